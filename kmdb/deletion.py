@@ -0,0 +1,86 @@
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from accounts.models import User
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from movies.models import Movie
+from reviews.models import Review
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kmdb-delete")
+
+
+def _raw_delete(queryset, using: str) -> int:
+    # QuerySet.delete() goes through the Collector, which loads every row as soon
+    # as signals or further cascades exist. The dependents here are known, so a
+    # single set-based DELETE ... WHERE is enough.
+    return queryset._raw_delete(using=using)
+
+
+def _delete_movie(movie_id: int, using: str) -> int:
+    genre_links = Movie.genres.through.objects.filter(
+        **{f"{Movie.genres.field.m2m_field_name()}_id": movie_id}
+    )
+    with transaction.atomic(using=using):
+        deleted = _raw_delete(Review.objects.filter(movie_id=movie_id), using)
+        deleted += _raw_delete(genre_links, using)
+        deleted += Movie.objects.using(using).filter(id=movie_id).delete()[0]
+    return deleted
+
+
+def _delete_user(user_id: int, using: str) -> int:
+    with transaction.atomic(using=using):
+        deleted = _raw_delete(Review.objects.filter(critic_id=user_id), using)
+        deleted += User.objects.using(using).filter(id=user_id).delete()[0]
+    return deleted
+
+
+class _Submit:
+    def __init__(self, run, state: dict):
+        self.run = run
+        self.state = state
+
+    def __call__(self):
+        self.state["submitted"] = True
+        _executor.submit(self.run)
+
+
+def _cancel_if_not_submitted(future: Future, state: dict):
+    if not state["submitted"]:
+        future.cancel()
+
+
+def _in_background(func, *args) -> Future:
+    # The whole delete is deferred, the movie/user row included: until the
+    # worker runs, the row is still visible to reads.
+    future = Future()
+    state = {"submitted": False}
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except Exception as error:
+            future.set_exception(error)
+        finally:
+            connections.close_all()
+
+    # Only submit after the request commits so the worker sees the final state.
+    # Django has no rollback hook, but a rollback drops the on_commit callback,
+    # and the finalizer then cancels the future instead of leaving it pending.
+    submit = _Submit(run, state)
+    weakref.finalize(submit, _cancel_if_not_submitted, future, state)
+    transaction.on_commit(submit, using=args[-1])
+    return future
+
+
+def delete_movie(movie_id: int, background: bool = False, using=DEFAULT_DB_ALIAS):
+    if background:
+        return _in_background(_delete_movie, movie_id, using)
+    return _delete_movie(movie_id, using)
+
+
+def delete_user(user_id: int, background: bool = False, using=DEFAULT_DB_ALIAS):
+    if background:
+        return _in_background(_delete_user, user_id, using)
+    return _delete_user(user_id, using)
@@ -0,0 +1,195 @@
+import datetime
+import decimal
+import json
+import uuid
+
+from django.http import HttpResponse
+from django.utils import timezone
+from genres.models import Genre
+from movies.models import Movie
+from reviews.models import Review
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Output layouts, in the same key order as the serializers. A (name, fields)
+# tuple is a nested object (or list of objects) built from the related model.
+MOVIE_LAYOUT = [
+    "id",
+    "title",
+    "premiere",
+    "duration",
+    "classification",
+    "synopsis",
+    ("genres", ["id", "name"]),
+]
+REVIEW_LAYOUT = [
+    "id",
+    "stars",
+    "review",
+    "spoilers",
+    "recomendation",
+    "movie_id",
+    ("critic", ["id", "first_name", "last_name"]),
+]
+
+
+def _to_json(value):
+    # Same representations DRF's fields produce for these types.
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        value = value.isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def _split(layout: list):
+    flat = [field for field in layout if isinstance(field, str)]
+    nested = [field for field in layout if not isinstance(field, str)]
+    return flat, nested
+
+
+def _assemble(layout: list, row: tuple, nested: dict) -> dict:
+    item = {}
+    values = iter(row)
+    for field in layout:
+        if isinstance(field, str):
+            item[field] = _to_json(next(values))
+        else:
+            item[field[0]] = nested[field[0]]
+    return item
+
+
+def _related_order(relation: str, order: str) -> str:
+    direction = "-" if order.startswith("-") else ""
+    return f"{direction}{relation}__{order.lstrip('-')}"
+
+
+def movie_rows(movie_ids: list, layout: list = MOVIE_LAYOUT) -> list:
+    flat, nested_fields = _split(layout)
+    rows = {
+        row[0]: row[1:]
+        for row in Movie.objects.filter(id__in=movie_ids).values_list("id", *flat)
+    }
+    genres = {movie_id: [] for movie_id in movie_ids}
+    genres_key = nested_fields[0][0] if nested_fields else None
+    for _, genre_fields in nested_fields:
+        through = Movie.genres.through
+        movie_field = Movie.genres.field.m2m_field_name()
+        genre_field = Movie.genres.field.m2m_reverse_field_name()
+        # Same ordering movie.genres.all() would give the serializer. Without
+        # Genre.Meta.ordering that query has no ORDER BY and its order depends
+        # on the backend; sqlite walks the (movie_id, genre_id) unique index, so
+        # fall back to the genre pk rather than the link's insertion order.
+        ordering = [
+            _related_order(genre_field, order)
+            for order in Genre._meta.ordering
+            if isinstance(order, str)
+        ]
+        links = (
+            through.objects.filter(**{f"{movie_field}_id__in": movie_ids})
+            .order_by(*ordering, f"{genre_field}_id")
+            .values_list(
+                f"{movie_field}_id",
+                *(f"{genre_field}__{field}" for field in genre_fields),
+            )
+        )
+        for movie_id, *values in links:
+            genres[movie_id].append(
+                {field: _to_json(value) for field, value in zip(genre_fields, values)}
+            )
+    return [
+        _assemble(layout, rows[movie_id], {genres_key: genres[movie_id]})
+        for movie_id in movie_ids
+        if movie_id in rows
+    ]
+
+
+def review_rows(review_ids: list, layout: list = REVIEW_LAYOUT) -> list:
+    flat, nested_fields = _split(layout)
+    critic_key, critic_fields = nested_fields[0] if nested_fields else (None, [])
+    rows = {
+        row[0]: row[1:]
+        for row in Review.objects.filter(id__in=review_ids).values_list(
+            "id", *flat, *(f"critic__{field}" for field in critic_fields)
+        )
+    }
+    results = []
+    for review_id in review_ids:
+        if review_id not in rows:
+            continue
+        row = rows[review_id]
+        critic = dict(zip(critic_fields, map(_to_json, row[len(flat) :])))
+        results.append(_assemble(layout, row[: len(flat)], {critic_key: critic}))
+    return results
+
+
+def _render_json(data) -> bytes:
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def render(data) -> bytes:
+    """Compact encoding matching DRF's JSONRenderer defaults for the ints,
+    strings, bools and dates of these layouts. orjson formats floats
+    differently, so layouts with float fields must not rely on byte equality."""
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the json module handles.
+            content = _render_json(data)
+    else:
+        content = _render_json(data)
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+def render_page(count: int, next_link, previous_link, results: list) -> bytes:
+    return render(
+        {
+            "count": count,
+            "next": next_link,
+            "previous": previous_link,
+            "results": results,
+        }
+    )
+
+
+RESOURCES = {
+    "movies": (movie_rows, MOVIE_LAYOUT),
+    "reviews": (review_rows, REVIEW_LAYOUT),
+}
+
+
+class FastListMixin:
+    """For ListAPIView/ListCreateAPIView: list() skips the serializer and builds
+    the page from ``fast_resource`` ("movies" or "reviews") rows. The response
+    is always compact JSON; renderer negotiation (e.g. ``; indent=``) is
+    bypassed."""
+
+    fast_resource = None
+    fast_layout = None
+
+    def list(self, request, *args, **kwargs):
+        rows, layout = RESOURCES[self.fast_resource]
+        queryset = self.filter_queryset(self.get_queryset())
+        ids = queryset.values_list("pk", flat=True)
+        page = self.paginate_queryset(ids)
+        ids = list(page if page is not None else ids)
+        results = rows(ids, self.fast_layout or layout)
+        if page is None:
+            content = render(results)
+        else:
+            # The paginator builds its own envelope, whatever its style.
+            content = render(self.get_paginated_response(results).data)
+        return HttpResponse(content, content_type="application/json")
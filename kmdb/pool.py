@@ -0,0 +1,172 @@
+import queue
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MAX_CONNECTIONS": 10,
+    "HEALTH_CHECKS": True,
+    "MAX_AGE": 300,
+}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _settings() -> dict:
+    return {**DEFAULTS, **getattr(settings, "KMDB_POOL", {})}
+
+
+def _discard(raw):
+    try:
+        raw.close()
+    except Exception:
+        pass
+
+
+class ConnectionPool:
+    """Raw DB-API connections shared by every thread of the worker.
+
+    Django keeps connections per thread, so a threaded server that starts a
+    thread per request never reuses them. The pool lends one to the thread's
+    connection wrapper for the duration of a request and takes it back after.
+    """
+
+    def __init__(self, alias: str, max_connections: int, health_checks, max_age):
+        self.alias = alias
+        self.health_checks = health_checks
+        self.max_age = max_age
+        self.idle = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.stats = Counter()
+        self.stats_lock = threading.Lock()
+
+    def count(self, metric: str, amount=1):
+        with self.stats_lock:
+            self.stats[metric] += amount
+
+    def acquire(self):
+        if not self.slots.acquire(blocking=False):
+            start = time.perf_counter()
+            self.slots.acquire()
+            self.count("waits")
+            self.count("wait_ms", (time.perf_counter() - start) * 1000)
+
+        wrapper = connections[self.alias]
+        if wrapper.connection is not None:
+            # This thread already holds a connection; it joins the pool on release.
+            return
+        while True:
+            try:
+                raw, created_at = self.idle.get_nowait()
+            except queue.Empty:
+                # The wrapper connects lazily, only if the request hits the db.
+                self.count("misses")
+                return
+            if time.monotonic() - created_at > self.max_age:
+                self.count("expired")
+                _discard(raw)
+                continue
+            wrapper.connection = raw
+            wrapper.autocommit = True
+            wrapper.close_at = None
+            wrapper.errors_occurred = False
+            if self.health_checks and not wrapper.is_usable():
+                self.count("health_check_failures")
+                wrapper.connection = None
+                _discard(raw)
+                continue
+            wrapper.kmdb_pool_created_at = created_at
+            self.count("hits")
+            return
+
+    def release(self):
+        wrapper = connections[self.alias]
+        try:
+            if wrapper.connection is None:
+                return
+            reusable = (
+                not wrapper.in_atomic_block
+                and not wrapper.errors_occurred
+                and wrapper.get_autocommit()
+            )
+            if not reusable:
+                self.count("discarded")
+                wrapper.close()
+                return
+            created_at = getattr(wrapper, "kmdb_pool_created_at", None)
+            self.idle.put((wrapper.connection, created_at or time.monotonic()))
+            # Detach so Django's end-of-request cleanup can't close it.
+            wrapper.connection = None
+            wrapper.kmdb_pool_created_at = None
+        finally:
+            self.slots.release()
+
+    def close(self):
+        while True:
+            try:
+                raw, _ = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            _discard(raw)
+
+
+def get_pool(alias: str) -> ConnectionPool:
+    with _pools_lock:
+        if alias not in _pools:
+            options = _settings()
+            _pools[alias] = ConnectionPool(
+                alias,
+                options["MAX_CONNECTIONS"],
+                options["HEALTH_CHECKS"],
+                options["MAX_AGE"],
+            )
+        return _pools[alias]
+
+
+def metrics() -> dict:
+    return {alias: dict(pool.stats) for alias, pool in _pools.items()}
+
+
+def close_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+def _count_opened(sender, connection, **kwargs):
+    connection.kmdb_pool_created_at = time.monotonic()
+    if connection.alias in _pools:
+        _pools[connection.alias].count("opened")
+
+
+connection_created.connect(_count_opened)
+
+
+class ConnectionPoolMiddleware:
+    """Must be the first middleware so the whole request runs on the pooled
+    connection. ``KMDB_POOL["ENABLED"] = False`` turns it into a no-op, checked
+    on every request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not _settings()["ENABLED"]:
+            return self.get_response(request)
+        pools = [get_pool(alias) for alias in connections]
+        acquired = []
+        try:
+            for pool in pools:
+                pool.acquire()
+                acquired.append(pool)
+            return self.get_response(request)
+        finally:
+            for pool in acquired:
+                pool.release()
@@ -0,0 +1,92 @@
+import json
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from kmdb.fastpath import render
+from reviews.models import Review
+
+PREVIEW_PARAM = "latest_reviews"
+MAX_PREVIEW_SIZE = 10
+
+
+def review_previews(movie_ids: list, size: int) -> dict:
+    # One query for the whole page: the database numbers each movie's reviews
+    # newest first in a single pass and only the first ``size`` come back. It
+    # still reads every review of the page's movies, not just ``size`` of them.
+    # Filtering on a window needs Django 4.2+.
+    rows = (
+        Review.objects.filter(movie_id__in=movie_ids)
+        .annotate(
+            preview_rank=Window(
+                RowNumber(), partition_by=[F("movie_id")], order_by=F("id").desc()
+            )
+        )
+        .filter(preview_rank__lte=size)
+        .order_by("movie_id", "-id")
+        .values_list(
+            "movie_id",
+            "id",
+            "stars",
+            "recomendation",
+            "critic__id",
+            "critic__first_name",
+            "critic__last_name",
+        )
+    )
+    previews = {movie_id: [] for movie_id in movie_ids}
+    for movie_id, review_id, stars, recomendation, *critic in rows:
+        previews[movie_id].append(
+            {
+                "id": review_id,
+                "stars": stars,
+                "recomendation": recomendation,
+                "critic": dict(zip(["id", "first_name", "last_name"], critic)),
+            }
+        )
+    return previews
+
+
+class ReviewPreviewMixin:
+    """For the movie list/detail views: ``?latest_reviews=N`` embeds the N most
+    recent reviews of each movie under the ``latest_reviews`` key.
+
+    Also works on top of FastListMixin, whose pre-rendered page is decoded and
+    rendered again when previews are requested."""
+
+    def review_preview_size(self) -> int:
+        try:
+            size = int(self.request.query_params.get(PREVIEW_PARAM, 0))
+        except ValueError:
+            return 0
+        return max(0, min(size, MAX_PREVIEW_SIZE))
+
+    def embed_review_previews(self, response):
+        size = self.review_preview_size()
+        if not size or response.status_code != 200:
+            return response
+        data = getattr(response, "data", None)
+        if data is not None:
+            self.add_review_previews(data, size)
+        else:
+            # FastListMixin answers with a plain HttpResponse.
+            data = json.loads(response.content)
+            self.add_review_previews(data, size)
+            response.content = render(data)
+        return response
+
+    def add_review_previews(self, data, size: int):
+        if isinstance(data, dict) and "results" in data:
+            movies = data["results"]
+        elif isinstance(data, list):
+            movies = data
+        else:
+            movies = [data]
+        previews = review_previews([movie["id"] for movie in movies], size)
+        for movie in movies:
+            movie[PREVIEW_PARAM] = previews[movie["id"]]
+
+    def list(self, request, *args, **kwargs):
+        return self.embed_review_previews(super().list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.embed_review_previews(super().retrieve(request, *args, **kwargs))
@@ -0,0 +1,142 @@
+import hashlib
+import random
+import warnings
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.permissions import SAFE_METHODS
+
+_request_state = ContextVar("kmdb_replica_request_state", default=None)
+
+
+def _replicas() -> list:
+    return getattr(settings, "KMDB_READ_REPLICAS", [])
+
+
+def _pin_seconds() -> int:
+    return getattr(settings, "KMDB_REPLICA_PIN_SECONDS", 5)
+
+
+def _primary_paths() -> list:
+    return getattr(settings, "KMDB_PRIMARY_PATHS", ["/admin/", "/api/users/"])
+
+
+def _pin_cache():
+    return caches[getattr(settings, "KMDB_REPLICA_PIN_CACHE", "default")]
+
+
+def _pin_key(identity: str) -> str:
+    return "kmdb-primary-pin:" + hashlib.sha256(identity.encode()).hexdigest()
+
+
+def _authenticated_user(request):
+    # Only a user that is already resolved: evaluating AuthenticationMiddleware's
+    # lazy user here would run queries from inside the router.
+    user = request.__dict__.get("user")
+    if isinstance(user, SimpleLazyObject):
+        user = None if user._wrapped is empty else user._wrapped
+    if user is not None and user.is_authenticated:
+        return user
+    return None
+
+
+def _client_keys(request) -> list:
+    # Clients are recognised by their credentials, never by address: behind a
+    # proxy or NAT every client shares one. DRF copies the authenticated user
+    # back onto the Django request, so once the view authenticated the user
+    # (force_authenticate included) the user id is known too.
+    identities = [
+        request.META.get("HTTP_AUTHORIZATION"),
+        request.COOKIES.get(settings.SESSION_COOKIE_NAME),
+    ]
+    user = _authenticated_user(request)
+    if user is not None:
+        identities.append(f"user:{user.pk}")
+    return [_pin_key(identity) for identity in identities if identity]
+
+
+class _RequestState:
+    def __init__(self, request):
+        self.request = request
+        self.checked = set()
+        self.pinned = False
+        self.checking = False
+
+    def use_replica(self) -> bool:
+        if self.pinned or self.checking:
+            return False
+        keys = [key for key in _client_keys(self.request) if key not in self.checked]
+        if keys:
+            self.checking = True
+            try:
+                self.pinned = bool(_pin_cache().get_many(keys))
+            finally:
+                self.checking = False
+            self.checked.update(keys)
+        return not self.pinned
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = _replicas()
+        state = _request_state.get()
+        if replicas and state is not None and state.use_replica():
+            return random.choice(replicas)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+
+class ReadReplicaMiddleware:
+    """Lets ReplicaRouter send a request's reads to a replica when it is a safe,
+    non admin request from a client that has not written in the last
+    KMDB_REPLICA_PIN_SECONDS.
+
+    The pins live in the KMDB_REPLICA_PIN_CACHE cache, which has to be shared by
+    every worker (redis, memcached, database): with a per-process cache,
+    read-your-writes only holds when the next read lands on the same process.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        pin_cache = _pin_cache()
+        if isinstance(pin_cache, DummyCache):
+            raise ImproperlyConfigured("ReadReplicaMiddleware needs a working cache")
+        if isinstance(pin_cache, LocMemCache):
+            warnings.warn(
+                "ReadReplicaMiddleware pins clients in a per-process LocMemCache; "
+                "read-your-writes breaks with more than one worker process.",
+                RuntimeWarning,
+            )
+
+    def __call__(self, request):
+        safe = request.method in SAFE_METHODS
+        primary_path = any(request.path.startswith(path) for path in _primary_paths())
+        state = _RequestState(request) if safe and not primary_path else None
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        if not safe:
+            self.pin(request, response)
+        return response
+
+    def pin(self, request, response):
+        keys = _client_keys(request)
+        data = getattr(response, "data", None)
+        if isinstance(data, dict) and data.get("token"):
+            # Login: the token is what the client's next requests will carry.
+            keys.append(_pin_key(f"Token {data['token']}"))
+        if keys:
+            _pin_cache().set_many({key: True for key in keys}, timeout=_pin_seconds())
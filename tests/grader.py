@@ -0,0 +1,222 @@
+import argparse
+import ast
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import venv
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+KIT_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(
+    os.environ.get("KMDB_GRADER_CACHE", Path.home() / ".cache/kmdb-grader")
+)
+SUITES = ["T1", "T2", "T3", "T4", "T5"]
+MODELS = {"User", "Genre", "Movie", "Review"}
+IGNORED = shutil.ignore_patterns(
+    ".git",
+    "__pycache__",
+    "*.pyc",
+    "venv",
+    ".venv",
+    "env",
+    "db.sqlite3",
+    "tests",
+    ".snapshots",
+)
+SETTINGS_PATTERN = re.compile(r"DJANGO_SETTINGS_MODULE['\"]\s*,\s*['\"]([\w.]+)['\"]")
+IMPORT_PATTERN = re.compile(r"^from \w+\.models import (\w+)$", re.MULTILINE)
+RAN_PATTERN = re.compile(r"^Ran (\d+) tests?", re.MULTILINE)
+FAILED_PATTERN = re.compile(r"^FAILED \((.*)\)$", re.MULTILINE)
+
+
+def find_models(project: Path) -> dict:
+    found = {}
+    for path in project.rglob("*.py"):
+        if "models" not in {path.stem, path.parent.name}:
+            continue
+        if any(part in {"venv", ".venv", "env", "tests"} for part in path.parts):
+            continue
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        parts = path.relative_to(project).with_suffix("").parts
+        # app/models/__init__.py is imported as app.models; importing it as
+        # app.models.__init__ would load the models twice.
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        module = ".".join(parts)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name in MODELS:
+                found.setdefault(node.name, module)
+    return found
+
+
+def map_imports(directory: Path, models: dict):
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in models:
+            return match.group(0)
+        return f"from {models[name]} import {name}"
+
+    for path in directory.rglob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        path.write_text(IMPORT_PATTERN.sub(replace, source), encoding="utf-8")
+
+
+def write_settings(workdir: Path) -> str:
+    match = SETTINGS_PATTERN.search((workdir / "manage.py").read_text())
+    if not match:
+        raise RuntimeError("DJANGO_SETTINGS_MODULE not found in manage.py")
+    (workdir / "grading_settings.py").write_text(
+        f"from {match.group(1)} import *  # noqa\n\n"
+        "DATABASES = {\n"
+        '    "default": {\n'
+        '        "ENGINE": "django.db.backends.sqlite3",\n'
+        f'        "NAME": {str(workdir / "db.sqlite3")!r},\n'
+        "    }\n"
+        "}\n"
+    )
+    return "grading_settings"
+
+
+def requirements(project: Path) -> list:
+    path = project / "requirements.txt"
+    lines = path.read_text().splitlines() if path.exists() else []
+    # Grading always runs on sqlite, and psycopg2 needs pg_config to build.
+    lines = [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.lower().startswith("psycopg2")
+    ]
+    return sorted(set(lines + ["faker"]))
+
+
+def environment(project: Path) -> Path:
+    packages = requirements(project)
+    key = hashlib.sha256("\n".join(packages + [sys.version]).encode()).hexdigest()[:16]
+    env_dir = CACHE_DIR / key
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / f"{key}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not (env_dir / ".ready").exists():
+            shutil.rmtree(env_dir, ignore_errors=True)
+            venv.create(env_dir, with_pip=True)
+            subprocess.run(
+                [env_dir / "bin/python", "-m", "pip", "install", "-q", *packages],
+                check=True,
+                capture_output=True,
+            )
+            (env_dir / ".ready").touch()
+    return env_dir / "bin/python"
+
+
+def parse_result(output: str) -> dict:
+    ran = RAN_PATTERN.search(output)
+    if not ran:
+        return {"status": "error", "passed": 0, "total": 0}
+    total = int(ran.group(1))
+    failed = 0
+    failures = FAILED_PATTERN.search(output)
+    if failures:
+        for item in failures.group(1).split(","):
+            kind, _, amount = item.strip().partition("=")
+            if kind in {"failures", "errors", "unexpected_successes"}:
+                failed += int(amount)
+    return {
+        "status": "fail" if failures else "ok",
+        "passed": total - failed,
+        "total": total,
+    }
+
+
+def grade(project: Path, suites: list, timeout: int) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="kmdb-grade-") as tmp:
+        workdir = Path(tmp) / project.name
+        try:
+            shutil.copytree(project, workdir, ignore=IGNORED)
+            for package in ("tests", "kmdb"):
+                shutil.copytree(KIT_ROOT / package, workdir / package, ignore=IGNORED)
+            models = find_models(workdir)
+            map_imports(workdir / "tests", models)
+            map_imports(workdir / "kmdb", models)
+            settings = write_settings(workdir)
+            python = environment(project)
+        except (OSError, RuntimeError, subprocess.CalledProcessError) as error:
+            failure = {"status": "error", "detail": str(error)}
+            return {suite: failure for suite in suites}
+
+        for suite in suites:
+            try:
+                completed = subprocess.run(
+                    [python, "manage.py", "test", f"tests/{suite}", "--noinput"],
+                    cwd=workdir,
+                    env={**os.environ, "DJANGO_SETTINGS_MODULE": settings},
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+                results[suite] = parse_result(completed.stderr + completed.stdout)
+            except subprocess.TimeoutExpired:
+                results[suite] = {"status": "timeout", "passed": 0, "total": 0}
+    return results
+
+
+def print_matrix(matrix: dict, suites: list):
+    width = max([len("project")] + [len(name) for name in matrix])
+    print("project".ljust(width), *(suite.rjust(9) for suite in suites))
+    for name in sorted(matrix):
+        cells = []
+        for suite in suites:
+            result = matrix[name][suite]
+            if result["status"] in {"ok", "fail"}:
+                cell = f"{result['passed']}/{result['total']}"
+            else:
+                cell = result["status"].upper()
+            cells.append(cell.rjust(9))
+        print(name.ljust(width), *cells)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the T1-T5 suites against every project in a directory."
+    )
+    parser.add_argument("projects", type=Path)
+    parser.add_argument("--suites", nargs="+", default=SUITES)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--timeout", type=int, default=600)
+    parser.add_argument("--json", type=Path, dest="json_path")
+    args = parser.parse_args()
+
+    projects = sorted(
+        path for path in args.projects.iterdir() if (path / "manage.py").exists()
+    )
+    matrix = {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {
+            pool.submit(grade, project, args.suites, args.timeout): project
+            for project in projects
+        }
+        for future in as_completed(futures):
+            try:
+                matrix[futures[future].name] = future.result()
+            except Exception as error:
+                # One broken project must not cost the matrix of the others.
+                failure = {"status": "error", "detail": repr(error)}
+                matrix[futures[future].name] = {suite: failure for suite in args.suites}
+
+    print_matrix(matrix, args.suites)
+    if args.json_path:
+        args.json_path.write_text(json.dumps(matrix, indent=2))
+
+
+if __name__ == "__main__":
+    main()
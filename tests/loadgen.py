@@ -0,0 +1,313 @@
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+from tests.mocks import movie_info, review_info, user_info
+
+SCENARIO = {
+    "list_movies": 45,
+    "list_reviews": 25,
+    "movie_reviews": 10,
+    "login": 8,
+    "post_review": 10,
+    "admin_patch": 1,
+    "admin_delete": 1,
+}
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+
+class Connection:
+    """A keep-alive HTTP/1.1 connection, reopened only when the server closes it."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            await self.writer.wait_closed()
+        self.reader = self.writer = None
+
+    async def request(self, method: str, path: str, body=None, token=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        payload = json.dumps(body).encode() if body is not None else b""
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            "Accept: application/json",
+            f"Content-Length: {len(payload)}",
+        ]
+        if payload:
+            headers.append("Content-Type: application/json")
+        if token:
+            headers.append(f"Authorization: Token {token}")
+        self.writer.write("\r\n".join(headers).encode() + b"\r\n\r\n" + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding") == "chunked":
+            content = b""
+            while size := int((await self.reader.readline()).strip(), 16):
+                chunk = await self.reader.readexactly(size + 2)
+                content += chunk[:-2]
+            await self.reader.readline()
+        elif "content-length" in response_headers:
+            content = await self.reader.readexactly(
+                int(response_headers["content-length"])
+            )
+        else:
+            content = await self.reader.read()
+            response_headers["connection"] = "close"
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        data = None
+        # Error pages (Django's 404/500) are HTML: only the status matters there.
+        if content and "json" in response_headers.get("content-type", ""):
+            try:
+                data = json.loads(content)
+            except ValueError:
+                pass
+        return status, data
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+
+    def record(self, route: str, elapsed: float, error=None):
+        self.latencies[route].append(elapsed * 1000)
+        if error:
+            self.errors[route][error] += 1
+
+    def report(self, duration: float):
+        total = sum(len(values) for values in self.latencies.values())
+        print(f"{total} requests in {duration:.1f}s ({total / duration:.1f} req/s)\n")
+        for route in sorted(self.latencies):
+            values = sorted(self.latencies[route])
+            quantiles = statistics.quantiles(values, n=100) if len(values) > 1 else []
+            p50, p95, p99 = (
+                (quantiles[49], quantiles[94], quantiles[98])
+                if quantiles
+                else values * 3
+            )
+            print(
+                f"{route}: {len(values)} requests, {len(values) / duration:.1f} req/s, "
+                f"p50 {p50:.1f}ms p95 {p95:.1f}ms p99 {p99:.1f}ms"
+            )
+            histogram = Counter(
+                bisect.bisect_left(BUCKETS_MS, value) for value in values
+            )
+            for index, count in sorted(histogram.items()):
+                bound = (
+                    f"<= {BUCKETS_MS[index]}ms"
+                    if index < len(BUCKETS_MS)
+                    else f"> {BUCKETS_MS[-1]}ms"
+                )
+                bar = "#" * (50 * count // len(values))
+                print(f"    {bound:>10} {count:>7} {bar}")
+            for error, count in self.errors[route].most_common():
+                print(f"    error {error}: {count}")
+        print()
+
+
+class Scenario:
+    def __init__(self, base_url: str, weights: dict, stats: Stats):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.prefix = url.path.rstrip("/") + "/"
+        self.weights = weights
+        self.stats = stats
+        self.critics = []
+        self.movie_ids = []
+        self.admin_token = None
+
+    async def call(self, connection, route, method, path, body=None, token=None):
+        start = time.perf_counter()
+        try:
+            status, content = await connection.request(
+                method, self.prefix + path, body, token
+            )
+        except (OSError, asyncio.IncompleteReadError, ValueError) as error:
+            await connection.close()
+            self.stats.record(route, time.perf_counter() - start, type(error).__name__)
+            return None, None
+        error = str(status) if status >= 400 else None
+        self.stats.record(route, time.perf_counter() - start, error)
+        return status, content
+
+    async def setup(self, critics: int, movies: int, admin_email, admin_password):
+        connection = Connection(self.host, self.port)
+        if admin_email:
+            _, content = await connection.request(
+                "POST",
+                self.prefix + "users/login/",
+                {"email": admin_email, "password": admin_password},
+            )
+            self.admin_token = content["token"]
+            for _ in range(movies):
+                _, movie = await connection.request(
+                    "POST", self.prefix + "movies/", movie_info(), self.admin_token
+                )
+                self.movie_ids.append(movie["id"])
+        else:
+            _, content = await connection.request("GET", self.prefix + "movies/")
+            self.movie_ids = [movie["id"] for movie in content["results"]]
+            self.weights = {
+                name: weight
+                for name, weight in self.weights.items()
+                if not name.startswith("admin_")
+            }
+        for _ in range(critics):
+            info = user_info()
+            await connection.request("POST", self.prefix + "users/register/", info)
+            _, content = await connection.request(
+                "POST",
+                self.prefix + "users/login/",
+                {"email": info["email"], "password": info["password"]},
+            )
+            self.critics.append((info, content["token"]))
+        await connection.close()
+        if not self.movie_ids:
+            raise RuntimeError("no movies to target, pass --admin-email to create them")
+
+    async def list_movies(self, connection):
+        await self.call(connection, "GET movies/", "GET", "movies/")
+
+    async def list_reviews(self, connection):
+        await self.call(connection, "GET reviews/", "GET", "reviews/")
+
+    async def movie_reviews(self, connection):
+        movie_id = random.choice(self.movie_ids)
+        await self.call(
+            connection,
+            "GET movies/{id}/reviews/",
+            "GET",
+            f"movies/{movie_id}/reviews/",
+        )
+
+    async def login(self, connection):
+        info, _ = random.choice(self.critics)
+        credentials = {"email": info["email"], "password": info["password"]}
+        await self.call(
+            connection, "POST users/login/", "POST", "users/login/", credentials
+        )
+
+    async def post_review(self, connection):
+        _, token = random.choice(self.critics)
+        movie_id = random.choice(self.movie_ids)
+        await self.call(
+            connection,
+            "POST movies/{id}/reviews/",
+            "POST",
+            f"movies/{movie_id}/reviews/",
+            review_info(),
+            token,
+        )
+
+    async def admin_patch(self, connection):
+        movie_id = random.choice(self.movie_ids)
+        await self.call(
+            connection,
+            "PATCH movies/{id}/",
+            "PATCH",
+            f"movies/{movie_id}/",
+            movie_info(),
+            self.admin_token,
+        )
+
+    async def admin_delete(self, connection):
+        # Deletes a throwaway movie so the pool the other routes hit stays intact.
+        status, movie = await self.call(
+            connection,
+            "POST movies/",
+            "POST",
+            "movies/",
+            movie_info(),
+            self.admin_token,
+        )
+        if status == 201:
+            await self.call(
+                connection,
+                "DELETE movies/{id}/",
+                "DELETE",
+                f"movies/{movie['id']}/",
+                token=self.admin_token,
+            )
+
+    async def user(self, deadline: float):
+        connection = Connection(self.host, self.port)
+        actions = [getattr(self, name) for name in self.weights]
+        weights = list(self.weights.values())
+        while time.perf_counter() < deadline:
+            await random.choices(actions, weights)[0](connection)
+        await connection.close()
+
+    async def run(self, users: int, duration: float) -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(self.user(start + duration) for _ in range(users)))
+        return time.perf_counter() - start
+
+
+def parse_weights(value: str) -> dict:
+    weights = dict(SCENARIO)
+    for item in filter(None, value.split(",")):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIO:
+            raise argparse.ArgumentTypeError(f"unknown action {name!r}")
+        weights[name] = float(weight)
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a weighted traffic mix against a running KMDb server."
+    )
+    parser.add_argument("--url", default="http://localhost:8000/api/")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--critics", type=int, default=20)
+    parser.add_argument("--movies", type=int, default=20)
+    parser.add_argument("--admin-email")
+    parser.add_argument("--admin-password")
+    parser.add_argument(
+        "--mix",
+        type=parse_weights,
+        default=SCENARIO,
+        help="Weights override, e.g. list_movies=60,admin_delete=0",
+    )
+    args = parser.parse_args()
+
+    stats = Stats()
+    scenario = Scenario(args.url, args.mix, stats)
+    await scenario.setup(
+        args.critics, args.movies, args.admin_email, args.admin_password
+    )
+    stats.report(await scenario.run(args.users, args.duration))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+import time
+
+from accounts.models import User
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from genres.models import Genre
+from kmdb.deletion import delete_movie, delete_user
+from movies.models import Movie
+from rest_framework import status
+from rest_framework.test import APITestCase
+from reviews.models import Review
+from tests.mocks import movie_genres, movie_info, review_info, user_info
+from tests.snapshots import restore_snapshot
+
+REVIEWS_PER_MOVIE = 50_000
+MAX_DELETE_QUERIES = 10
+MAX_DELETE_SECONDS = 2.0
+
+
+class DeletionTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        restore_snapshot("movie-reviews-50k")
+        cls.base_url = "http://localhost:8000/api/"
+        cls.user_info = user_info()
+        cls.movie = Movie.objects.get()
+        cls.critics = list(User.objects.order_by("id"))
+
+    def assertBoundedDelete(self, queries: CaptureQueriesContext, elapsed: float):
+        self.assertLessEqual(len(queries), MAX_DELETE_QUERIES)
+        self.assertLess(elapsed, MAX_DELETE_SECONDS)
+
+    def test_if_movie_with_many_reviews_can_be_deleted_in_bounded_time(self):
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            delete_movie(self.movie.id)
+        elapsed = time.perf_counter() - start
+
+        self.assertBoundedDelete(queries, elapsed)
+        self.assertFalse(Movie.objects.filter(id=self.movie.id).exists())
+        self.assertFalse(Review.objects.filter(movie_id=self.movie.id).exists())
+        self.assertEqual(Genre.objects.count(), len(movie_genres))
+
+    def test_if_critic_with_many_reviews_can_be_deleted_in_bounded_time(self):
+        critic: User = self.critics[0]
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            delete_user(critic.id)
+        elapsed = time.perf_counter() - start
+
+        self.assertBoundedDelete(queries, elapsed)
+        self.assertFalse(User.objects.filter(id=critic.id).exists())
+        self.assertFalse(Review.objects.filter(critic_id=critic.id).exists())
+        self.assertEqual(
+            Review.objects.count(),
+            REVIEWS_PER_MOVIE - REVIEWS_PER_MOVIE // len(self.critics),
+        )
+
+    def test_if_delete_movie_route_is_bounded_with_many_reviews(self):
+        self.client.force_authenticate(
+            user=User.objects.create_superuser(**self.user_info)
+        )
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(
+                f"{self.base_url}movies/{self.movie.id}/", format="json"
+            )
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertBoundedDelete(queries, elapsed)
+        self.assertFalse(Movie.objects.filter(id=self.movie.id).exists())
+        self.assertFalse(Review.objects.filter(movie_id=self.movie.id).exists())
+
+
+# TransactionTestCase: the worker thread uses its own connection, so it only
+# sees committed rows.
+class BackgroundDeletionTests(TransactionTestCase):
+    def setUp(self):
+        movie_inf = movie_info()
+        genres = movie_inf.pop("genres")
+        movie: Movie = Movie.objects.create(**movie_inf)
+        for genre in genres:
+            found_genre = Genre.objects.get_or_create(**genre)[0]
+            movie.genres.add(found_genre)
+        self.movie = movie
+        critic: User = User.objects.create_user(**user_info())
+        Review.objects.bulk_create(
+            [Review(**review_info(), movie=movie, critic=critic) for _ in range(10)]
+        )
+
+    def test_if_background_delete_runs_after_commit(self):
+        with transaction.atomic():
+            future = delete_movie(self.movie.id, background=True)
+            self.assertFalse(future.done())
+            self.assertTrue(Movie.objects.filter(id=self.movie.id).exists())
+        future.result(timeout=10)
+        self.assertFalse(Movie.objects.filter(id=self.movie.id).exists())
+        self.assertFalse(Review.objects.filter(movie_id=self.movie.id).exists())
+
+    def test_if_background_delete_is_cancelled_on_rollback(self):
+        with transaction.atomic():
+            future = delete_movie(self.movie.id, background=True)
+            transaction.set_rollback(True)
+        self.assertTrue(future.cancelled())
+        self.assertTrue(Movie.objects.filter(id=self.movie.id).exists())
+        self.assertEqual(Review.objects.filter(movie_id=self.movie.id).count(), 10)
@@ -0,0 +1,183 @@
+import os
+import timeit
+from unittest import skipUnless
+from urllib.parse import urlsplit
+
+from accounts.models import User
+from django.urls import resolve
+from genres.models import Genre
+from kmdb.fastpath import (
+    FastListMixin,
+    movie_rows,
+    render,
+    render_page,
+    review_rows,
+)
+from movies.models import Movie
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ListSerializer
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from reviews.models import Review
+from tests.mocks import movie_info, review_info, user_info
+from tests.snapshots import restore_snapshot
+
+BENCHMARK_PAGE_SIZES = [10, 100, 1000]
+
+
+def readable(fields: dict) -> list:
+    return [name for name, field in fields.items() if not field.write_only]
+
+
+def layout_of(serializer_class) -> list:
+    # Built from the serializer declaration, never from the response under test.
+    fields = serializer_class().fields
+    layout = []
+    for name in readable(fields):
+        field = fields[name]
+        if isinstance(field, ListSerializer):
+            layout.append((name, readable(field.child.fields)))
+        elif hasattr(field, "fields"):
+            layout.append((name, readable(field.fields)))
+        else:
+            layout.append(name)
+    return layout
+
+
+def view_class_of(url: str):
+    match = resolve(urlsplit(url).path)
+    return match.func.cls, match.kwargs
+
+
+class FastPathTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_url = "http://localhost:8000/api/"
+        cls.user = User.objects.create_superuser(**user_info())
+        for _ in range(4):
+            movie_inf = movie_info()
+            genres = movie_inf.pop("genres")
+            movie: Movie = Movie.objects.create(**movie_inf)
+            for genre in genres:
+                found_genre = Genre.objects.get_or_create(**genre)[0]
+                movie.genres.add(found_genre)
+        cls.movie = movie
+        reviews = [
+            Review(**review_info(), movie=movie, critic=cls.user) for _ in range(4)
+        ]
+        Review.objects.bulk_create(reviews)
+
+    def assertSamePage(self, response, rows):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        view_class, _ = view_class_of(response.request["PATH_INFO"])
+        ids = [item["id"] for item in body["results"]]
+        results = rows(ids, layout_of(view_class.serializer_class))
+        expected = render_page(body["count"], body["next"], body["previous"], results)
+        self.assertEqual(response.content, expected)
+
+    def assertSamePages(self, url, rows):
+        response = self.client.get(url, format="json")
+        self.assertSamePage(response, rows)
+        response2 = self.client.get(response.json()["next"], format="json")
+        self.assertSamePage(response2, rows)
+
+    def assertMixinMatchesRoute(self, url: str, resource: str):
+        view_class, kwargs = view_class_of(url)
+        if not hasattr(view_class, "list"):
+            self.skipTest(f"{view_class.__name__} is not a generic list view")
+        fast_view = type(
+            f"Fast{view_class.__name__}",
+            (FastListMixin, view_class),
+            {
+                "fast_resource": resource,
+                "fast_layout": layout_of(view_class.serializer_class),
+            },
+        ).as_view()
+        while url:
+            self.client.force_authenticate(user=self.user)
+            expected = self.client.get(url, format="json")
+            request = APIRequestFactory().get(url, format="json")
+            force_authenticate(request, user=self.user)
+            response = fast_view(request, **kwargs)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.content, expected.content)
+            url = expected.json()["next"]
+
+    def test_if_fast_path_matches_movie_list_route(self):
+        self.assertSamePages(f"{self.base_url}movies/", movie_rows)
+
+    def test_if_fast_path_matches_review_list_route(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertSamePages(f"{self.base_url}reviews/", review_rows)
+
+    def test_if_fast_path_matches_movie_reviews_route(self):
+        self.assertSamePages(
+            f"{self.base_url}movies/{self.movie.id}/reviews/", review_rows
+        )
+
+    def test_if_fast_list_mixin_matches_movie_list_route(self):
+        self.assertMixinMatchesRoute(f"{self.base_url}movies/", "movies")
+
+    def test_if_fast_list_mixin_matches_review_list_route(self):
+        self.assertMixinMatchesRoute(f"{self.base_url}reviews/", "reviews")
+
+    def test_if_fast_list_mixin_matches_movie_reviews_route(self):
+        self.assertMixinMatchesRoute(
+            f"{self.base_url}movies/{self.movie.id}/reviews/", "reviews"
+        )
+
+    def test_if_movie_fast_path_query_count_is_fixed(self):
+        ids = list(Movie.objects.values_list("id", flat=True))
+        with self.assertNumQueries(2):
+            movie_rows(ids[:1])
+        with self.assertNumQueries(2):
+            movie_rows(ids)
+
+    def test_if_review_fast_path_query_count_is_fixed(self):
+        ids = list(Review.objects.values_list("id", flat=True))
+        with self.assertNumQueries(1):
+            review_rows(ids[:1])
+        with self.assertNumQueries(1):
+            review_rows(ids)
+
+
+def benchmark(test: APITestCase, route: str, model, rows):
+    serializer_class = resolve(f"/api/{route}").func.cls.serializer_class
+    all_ids = list(model.objects.order_by("id").values_list("id", flat=True))
+    print(f"\n{route}  page size | serializer ms | fast path ms | speedup")
+    for page_size in BENCHMARK_PAGE_SIZES:
+        ids = all_ids[:page_size]
+
+        def serializer_path():
+            queryset = model.objects.filter(id__in=ids).order_by("id")
+            return JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+        def fast_path():
+            return render(rows(ids, layout))
+
+        layout = layout_of(serializer_class)
+        test.assertEqual(fast_path(), serializer_path())
+        slow = min(timeit.repeat(serializer_path, number=1, repeat=5)) * 1000
+        fast = min(timeit.repeat(fast_path, number=1, repeat=5)) * 1000
+        print(f"{page_size:>17} | {slow:>13.1f} | {fast:>12.1f} | {slow / fast:.1f}x")
+
+
+@skipUnless(os.environ.get("KMDB_BENCHMARK"), "set KMDB_BENCHMARK=1 to run")
+class MovieFastPathBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        restore_snapshot("catalog-10k")
+
+    def test_movie_list_speedup_per_page_size(self):
+        benchmark(self, "movies/", Movie, movie_rows)
+
+
+@skipUnless(os.environ.get("KMDB_BENCHMARK"), "set KMDB_BENCHMARK=1 to run")
+class ReviewFastPathBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        restore_snapshot("reviews-100k")
+
+    def test_review_list_speedup_per_page_size(self):
+        benchmark(self, "reviews/", Review, review_rows)
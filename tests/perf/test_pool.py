@@ -0,0 +1,141 @@
+import json
+import statistics
+import threading
+import time
+import urllib.request
+from unittest import skipIf
+
+from django.conf import settings
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import LiveServerTestCase, override_settings
+from genres.models import Genre
+from kmdb.pool import close_pools, metrics
+from movies.models import Movie
+from tests.mocks import movie_info, review_info, user_info
+
+THREADS = 16
+FLOWS_PER_THREAD = 5
+MAX_CONNECTIONS = 4
+
+
+def request(method: str, url: str, body=None, token=None):
+    data = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Token {token}"
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read() or "null")
+
+
+# The live server shares a single connection across threads on in-memory sqlite,
+# so there is nothing to measure there.
+@skipIf(connection.vendor == "sqlite", "needs a server-backed database")
+@override_settings(
+    MIDDLEWARE=["kmdb.pool.ConnectionPoolMiddleware", *settings.MIDDLEWARE]
+)
+class ConnectionReuseBenchmark(LiveServerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.opened = 0
+        cls.lock = threading.Lock()
+        connection_created.connect(cls.count_connection)
+
+    @classmethod
+    def tearDownClass(cls):
+        connection_created.disconnect(cls.count_connection)
+        super().tearDownClass()
+        close_pools()
+
+    @classmethod
+    def count_connection(cls, sender, **kwargs):
+        with cls.lock:
+            cls.opened += 1
+
+    def setUp(self):
+        self.base_url = f"{self.live_server_url}/api/"
+        movie_inf = movie_info()
+        genres = movie_inf.pop("genres")
+        movie: Movie = Movie.objects.create(**movie_inf)
+        for genre in genres:
+            found_genre = Genre.objects.get_or_create(**genre)[0]
+            movie.genres.add(found_genre)
+        self.movie = movie
+
+    def flow(self, latencies: list):
+        info = user_info()
+        credentials = {"email": info["email"], "password": info["password"]}
+        steps = [
+            ("POST", "users/register/", info, False),
+            ("POST", "users/login/", credentials, False),
+            ("GET", "movies/", None, False),
+            ("GET", f"movies/{self.movie.id}/", None, False),
+            ("POST", f"movies/{self.movie.id}/reviews/", review_info(), True),
+            ("GET", f"movies/{self.movie.id}/reviews/", None, False),
+            ("GET", "reviews/", None, False),
+        ]
+        token = None
+        for method, path, body, authenticated in steps:
+            start = time.perf_counter()
+            content = request(
+                method, self.base_url + path, body, token if authenticated else None
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+            if path == "users/login/":
+                token = content["token"]
+
+    def replay(self, enabled: bool) -> dict:
+        latencies = []
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(FLOWS_PER_THREAD):
+                    self.flow(latencies)
+            except Exception as error:
+                errors.append(error)
+
+        close_pools()
+        type(self).opened = 0
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        pool_settings = {"ENABLED": enabled, "MAX_CONNECTIONS": MAX_CONNECTIONS}
+        # Read by the middleware on every request, live server threads included.
+        with override_settings(KMDB_POOL=pool_settings):
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+        self.assertEqual(errors, [])
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        return {
+            "requests": len(latencies),
+            "seconds": round(elapsed, 2),
+            "p50_ms": round(quantiles[49], 1),
+            "p95_ms": round(quantiles[94], 1),
+            "connections_opened": self.opened,
+            "pool": metrics().get(connection.alias, {}),
+        }
+
+    def report(self, off: dict, on: dict):
+        print(f"\n{'':<20}{'pool off':>10}{'pool on':>10}{'delta':>10}")
+        for metric in ["seconds", "p50_ms", "p95_ms", "connections_opened"]:
+            delta = round(on[metric] - off[metric], 2)
+            print(f"{metric:<20}{off[metric]:>10}{on[metric]:>10}{delta:>+10}")
+        print(f"pool: {on['pool']}")
+
+    def test_replay_t2_t4_flows_with_and_without_connection_reuse(self):
+        off = self.replay(enabled=False)
+        on = self.replay(enabled=True)
+        self.report(off, on)
+
+        self.assertEqual(on["requests"], off["requests"])
+        self.assertGreaterEqual(off["connections_opened"], THREADS)
+        self.assertLessEqual(on["connections_opened"], MAX_CONNECTIONS)
+        self.assertGreater(on["pool"]["hits"], on["pool"].get("misses", 0))
+        # Loose bound: the point is the side by side report, not timing noise.
+        self.assertLess(on["p50_ms"], off["p50_ms"] * 1.25)
@@ -0,0 +1,147 @@
+import json
+from urllib.parse import urlsplit
+
+from accounts.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from genres.models import Genre
+from kmdb.fastpath import FastListMixin
+from kmdb.previews import MAX_PREVIEW_SIZE, ReviewPreviewMixin
+from movies.models import Movie
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from reviews.models import Review
+from tests.mocks import movie_info, review_info, user_info
+
+PREVIEW_SIZE = 3
+
+
+class ReviewPreviewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_url = "http://localhost:8000/api/"
+        cls.critics = [User.objects.create_user(**user_info()) for _ in range(3)]
+        cls.movies = []
+        for amount in [0, 2, 5]:
+            movie_inf = movie_info()
+            genres = movie_inf.pop("genres")
+            movie: Movie = Movie.objects.create(**movie_inf)
+            for genre in genres:
+                found_genre = Genre.objects.get_or_create(**genre)[0]
+                movie.genres.add(found_genre)
+            cls.add_reviews(movie, amount)
+            cls.movies.append(movie)
+
+    @classmethod
+    def add_reviews(cls, movie: Movie, amount: int):
+        for index in range(amount):
+            Review.objects.create(
+                **review_info(),
+                movie=movie,
+                critic=cls.critics[index % len(cls.critics)],
+            )
+
+    def get(self, url: str, *mixins, **attributes):
+        """Calls the project's view for ``url`` with the kit mixins mounted, so
+        the tests cover the kit whether or not the project adopted them."""
+        match = resolve(urlsplit(url).path)
+        view_class = match.func.cls
+        bases = [mixin for mixin in mixins if not issubclass(view_class, mixin)]
+        view = type(
+            f"Preview{view_class.__name__}", (*bases, view_class), attributes
+        ).as_view()
+        response = view(APIRequestFactory().get(url, format="json"), **match.kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, json.loads(response.content)
+
+    def get_previews(self, url: str):
+        return self.get(url, ReviewPreviewMixin)
+
+    def get_route_reviews(self, movie_id: int) -> dict:
+        reviews = {}
+        url = f"{self.base_url}movies/{movie_id}/reviews/"
+        while url:
+            response = self.client.get(url, format="json")
+            for review in response.json()["results"]:
+                reviews[review["id"]] = review
+            url = response.json()["next"]
+        return reviews
+
+    def assertPreviewMatchesReviewsRoute(self, movie: dict, size=PREVIEW_SIZE):
+        expected_ids = list(
+            Review.objects.filter(movie_id=movie["id"])
+            .order_by("-id")
+            .values_list("id", flat=True)[:size]
+        )
+        self.assertEqual(
+            [review["id"] for review in movie["latest_reviews"]], expected_ids
+        )
+        route_reviews = self.get_route_reviews(movie["id"])
+        for review in movie["latest_reviews"]:
+            route_review = route_reviews[review["id"]]
+            self.assertEqual(review["stars"], route_review["stars"])
+            self.assertEqual(review["recomendation"], route_review["recomendation"])
+            for field, value in review["critic"].items():
+                if field in route_review["critic"]:
+                    self.assertEqual(value, route_review["critic"][field])
+
+    def test_if_movie_list_embeds_latest_reviews(self):
+        response, body = self.get_previews(
+            f"{self.base_url}movies/?latest_reviews={PREVIEW_SIZE}"
+        )
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(len(body["results"]), len(self.movies))
+        for movie in body["results"]:
+            self.assertPreviewMatchesReviewsRoute(movie)
+
+    def test_if_movie_detail_embeds_latest_reviews(self):
+        movie: Movie = self.movies[-1]
+        _, body = self.get_previews(
+            f"{self.base_url}movies/{movie.id}/?latest_reviews={PREVIEW_SIZE}"
+        )
+        self.assertEqual(len(body["latest_reviews"]), PREVIEW_SIZE)
+        self.assertPreviewMatchesReviewsRoute(body)
+
+    def test_if_preview_is_capped_for_movies_with_many_reviews(self):
+        movie: Movie = self.movies[-1]
+        self.add_reviews(movie, 3 * MAX_PREVIEW_SIZE)
+        _, body = self.get_previews(
+            f"{self.base_url}movies/{movie.id}/?latest_reviews=100"
+        )
+        self.assertEqual(len(body["latest_reviews"]), MAX_PREVIEW_SIZE)
+        self.assertPreviewMatchesReviewsRoute(body, MAX_PREVIEW_SIZE)
+
+    def test_if_previews_work_on_top_of_fast_list_mixin(self):
+        response, body = self.get(
+            f"{self.base_url}movies/?latest_reviews={PREVIEW_SIZE}",
+            ReviewPreviewMixin,
+            FastListMixin,
+            fast_resource="movies",
+        )
+        self.assertEqual(response["Content-Type"], "application/json")
+        for movie in body["results"]:
+            self.assertPreviewMatchesReviewsRoute(movie)
+
+    def test_if_previews_are_opt_in(self):
+        _, body = self.get_previews(f"{self.base_url}movies/")
+        for movie in body["results"]:
+            self.assertNotIn("latest_reviews", movie)
+
+    def test_if_preview_query_count_is_constant_per_page(self):
+        url = f"{self.base_url}movies/"
+        with CaptureQueriesContext(connection) as without_previews:
+            self.get_previews(url)
+        with CaptureQueriesContext(connection) as few_reviews:
+            self.get_previews(f"{url}?latest_reviews={PREVIEW_SIZE}")
+        for movie in self.movies:
+            self.add_reviews(movie, 20)
+        with CaptureQueriesContext(connection) as many_reviews:
+            _, body = self.get_previews(f"{url}?latest_reviews={PREVIEW_SIZE}")
+
+        self.assertEqual(len(few_reviews), len(without_previews) + 1)
+        self.assertEqual(len(many_reviews), len(few_reviews))
+        for movie in body["results"]:
+            self.assertEqual(len(movie["latest_reviews"]), PREVIEW_SIZE)
@@ -0,0 +1,124 @@
+import time
+from unittest import skipUnless
+
+from accounts.models import User
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from genres.models import Genre
+from movies.models import Movie
+from rest_framework import status
+from rest_framework.test import APITestCase
+from reviews.models import Review
+from tests.mocks import movie_info, review_info, user_info
+
+PIN_SECONDS = 1
+
+
+@skipUnless("replica" in settings.DATABASES, "needs a 'replica' database")
+@override_settings(
+    DATABASE_ROUTERS=["kmdb.routers.ReplicaRouter"],
+    MIDDLEWARE=[*settings.MIDDLEWARE, "kmdb.routers.ReadReplicaMiddleware"],
+    KMDB_READ_REPLICAS=["replica"],
+)
+class ReplicaRoutingTests(APITestCase):
+    databases = {"default", "replica"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_url = "http://localhost:8000/api/"
+        cls.user_info = user_info()
+        cls.review_info = review_info()
+        cls.movie_info = movie_info()
+        genres = cls.movie_info.pop("genres")
+        movie: Movie = Movie.objects.create(**cls.movie_info)
+        for genre in genres:
+            found_genre = Genre.objects.get_or_create(**genre)[0]
+            movie.genres.add(found_genre)
+        cls.movie = movie
+        # Stale copy of the movie on the replica: same id, different data.
+        replica_movie_info = movie_info()
+        replica_movie_info.pop("genres")
+        cls.replica_movie = Movie.objects.using("replica").create(
+            id=movie.id, **replica_movie_info
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def post_review(self) -> Review:
+        user: User = User.objects.create_user(**self.user_info)
+        self.client.force_authenticate(user=user)
+        response = self.client.post(
+            f"{self.base_url}movies/{self.movie.id}/reviews/",
+            self.review_info,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Review.objects.get(id=response.json()["id"])
+
+    def get_movie_review_ids(self, **extra) -> list:
+        response = self.client.get(
+            f"{self.base_url}movies/{self.movie.id}/reviews/", format="json", **extra
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [review["id"] for review in response.json()["results"]]
+
+    def test_if_anonymous_reads_go_to_replica(self):
+        response = self.client.get(f"{self.base_url}movies/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [movie["title"] for movie in response.json()["results"]],
+            [self.replica_movie.title],
+        )
+
+    def test_if_writes_go_to_primary(self):
+        review = self.post_review()
+        self.assertTrue(Review.objects.using("default").filter(id=review.id).exists())
+        self.assertFalse(Review.objects.using("replica").exists())
+
+    def test_if_client_reads_its_own_writes(self):
+        review = self.post_review()
+        self.assertEqual(self.get_movie_review_ids(), [review.id])
+
+    def test_if_other_clients_are_not_pinned_to_primary(self):
+        self.post_review()
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.get_movie_review_ids(), [])
+
+    def test_if_clients_behind_the_same_address_are_not_pinned(self):
+        self.post_review()
+        self.client.force_authenticate(user=User.objects.create_user(**user_info()))
+        self.assertEqual(self.get_movie_review_ids(REMOTE_ADDR="127.0.0.1"), [])
+
+    def test_if_login_pins_the_returned_token(self):
+        user: User = User.objects.create_user(**self.user_info)
+        Review.objects.create(**self.review_info, movie=self.movie, critic=user)
+        response = self.client.post(
+            f"{self.base_url}users/login/",
+            {"email": self.user_info["email"], "password": self.user_info["password"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The token only exists on the primary, so an unpinned read would be a 401.
+        token = response.json()["token"]
+        self.assertEqual(
+            len(self.get_movie_review_ids(HTTP_AUTHORIZATION=f"Token {token}")), 1
+        )
+
+    @override_settings(KMDB_REPLICA_PIN_SECONDS=PIN_SECONDS)
+    def test_if_reads_go_back_to_replica_after_pin_window(self):
+        # A zero timeout means "don't cache" for Django caches, so the window
+        # has to be real to prove pins expire.
+        review = self.post_review()
+        self.assertEqual(self.get_movie_review_ids(), [review.id])
+        time.sleep(PIN_SECONDS + 0.5)
+        self.assertEqual(self.get_movie_review_ids(), [])
+
+    def test_if_admin_routes_stay_on_primary(self):
+        self.client.force_authenticate(
+            user=User.objects.create_superuser(**self.user_info)
+        )
+        response = self.client.get(f"{self.base_url}users/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
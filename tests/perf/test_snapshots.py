@@ -0,0 +1,73 @@
+import inspect
+from pathlib import Path
+from unittest import mock
+
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase
+from movies.models import Movie
+from reviews.models import Review
+from tests import mocks, snapshots
+from tests.snapshots import _fingerprint, _sources, dataset, restore_snapshot
+
+RESTORED_DATASET = "reviews-100k"
+MAX_RESTORE_SECONDS = 2
+
+
+@dataset("fingerprint-test")
+def fingerprint_test():
+    pass
+
+
+class SnapshotFingerprintTests(SimpleTestCase):
+    name = "fingerprint-test"
+
+    def assertChangesWith(self, changed: Path):
+        original = _fingerprint(self.name)
+        read_bytes = Path.read_bytes
+
+        def edited(path):
+            content = read_bytes(path)
+            return content + b"\n# edited\n" if path == changed else content
+
+        with mock.patch.object(Path, "read_bytes", autospec=True, side_effect=edited):
+            self.assertNotEqual(_fingerprint(self.name), original, changed)
+        self.assertEqual(_fingerprint(self.name), original)
+
+    def test_if_fingerprint_is_stable(self):
+        self.assertEqual(_fingerprint(self.name), _fingerprint(self.name))
+
+    def test_if_model_change_changes_fingerprint(self):
+        for model in (Movie, Review):
+            self.assertChangesWith(Path(inspect.getsourcefile(model)))
+
+    def test_if_migration_change_changes_fingerprint(self):
+        sources = _sources(self.name)
+        migrations = [path for path in sources if "migrations" in path.parts]
+        self.assertTrue(migrations)
+        self.assertChangesWith(migrations[-1])
+
+    def test_if_mocks_change_changes_fingerprint(self):
+        self.assertChangesWith(Path(mocks.__file__))
+
+    def test_if_snapshot_code_change_changes_fingerprint(self):
+        self.assertChangesWith(Path(snapshots.__file__))
+
+    def test_if_builder_module_change_changes_fingerprint(self):
+        self.assertChangesWith(Path(__file__))
+
+    def test_if_each_dataset_has_its_own_fingerprint(self):
+        self.assertNotEqual(_fingerprint(self.name), _fingerprint(RESTORED_DATASET))
+
+
+class SnapshotRestoreTests(TestCase):
+    def test_if_snapshot_restore_is_fast(self):
+        # The first restore may have to build the snapshot file.
+        with transaction.atomic():
+            restore_snapshot(RESTORED_DATASET)
+            transaction.set_rollback(True)
+        self.assertFalse(Review.objects.exists())
+
+        elapsed = restore_snapshot(RESTORED_DATASET)
+        print(f"\n{RESTORED_DATASET} restored in {elapsed * 1000:.0f}ms")
+        self.assertEqual(Review.objects.count(), 100_000)
+        self.assertLess(elapsed, MAX_RESTORE_SECONDS)
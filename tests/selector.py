@@ -0,0 +1,255 @@
+import argparse
+import ast
+import fnmatch
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_FILE = Path(__file__).parent / ".selector-cache.json"
+LOCAL_PACKAGES = {"tests", "kmdb"}
+ROUTES = {"users/": "User", "movies/": "Movie", "reviews/": "Review"}
+# Movie responses embed their genres, so the movies route also depends on Genre.
+ROUTE_EXTRAS = {"movies/": ["Genre"]}
+DOC_SUFFIXES = {".md", ".rst"}
+# Dependency changes can break any suite.
+DEPENDENCY_FILES = ["requirements*.txt", "Pipfile*", "pyproject.toml"]
+FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _is_app(module: str) -> bool:
+    return module.endswith(".models") and (ROOT / module.split(".")[0]).is_dir()
+
+
+def _imports(tree: ast.Module) -> dict:
+    names = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                names[alias.asname or alias.name] = node.module
+    return names
+
+
+def _module_file(module: str):
+    path = ROOT.joinpath(*module.split("."))
+    for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _local_closure(module: str, seen: set) -> set:
+    """Project files reached from a local module through its imports."""
+    path = _module_file(module)
+    if not path or path in seen:
+        return set()
+    seen.add(path)
+    files = {path.relative_to(ROOT).as_posix()}
+    for imported in set(_imports(ast.parse(path.read_text())).values()):
+        if imported.split(".")[0] in LOCAL_PACKAGES:
+            files |= _local_closure(imported, seen)
+        elif _is_app(imported):
+            files.add(imported.split(".")[0] + "/")
+    return files
+
+
+def _strings(node: ast.AST) -> list:
+    return [
+        child.value
+        for child in ast.walk(node)
+        if isinstance(child, ast.Constant) and isinstance(child.value, str)
+    ]
+
+
+def _kit_modules() -> set:
+    return {
+        path.relative_to(ROOT).as_posix() for path in (ROOT / "kmdb").glob("**/*.py")
+    }
+
+
+def _dependencies(nodes: list, imports: dict) -> set:
+    models = {name: module for name, module in imports.items() if _is_app(module)}
+    used = {
+        child.id
+        for node in nodes
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name)
+    }
+    deps = set()
+    for name in used & imports.keys():
+        module = imports[name]
+        if name in models:
+            deps.add(module.split(".")[0] + "/")
+        elif module.split(".")[0] in LOCAL_PACKAGES:
+            deps |= _local_closure(module, set())
+    for text in (text for node in nodes for text in _strings(node)):
+        for route, model in ROUTES.items():
+            if route in text:
+                # The project may mount any kit middleware, router or mixin
+                # on the routes, so they all count.
+                deps |= _kit_modules()
+                for dependency in [model] + ROUTE_EXTRAS.get(route, []):
+                    if dependency in models:
+                        deps.add(models[dependency].split(".")[0] + "/")
+    return deps
+
+
+def _test_files() -> list:
+    return sorted((ROOT / "tests").glob("**/test_*.py"))
+
+
+def _fingerprint() -> str:
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for package in LOCAL_PACKAGES:
+        for path in sorted((ROOT / package).glob("**/*.py")):
+            digest.update(path.as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _definitions(tree: ast.Module) -> dict:
+    """Module level functions, classes and constants by name."""
+    definitions = {}
+    for node in tree.body:
+        if isinstance(node, (*FUNCTIONS, ast.ClassDef)):
+            definitions[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for child in ast.walk(target):
+                    if isinstance(child, ast.Name):
+                        definitions[child.id] = node
+    return definitions
+
+
+def _with_helpers(nodes: list, definitions: dict) -> list:
+    """``nodes`` plus every module level definition they reach by name."""
+    reached = list(nodes)
+    seen = {id(node) for node in nodes}
+    pending = list(nodes)
+    while pending:
+        for child in ast.walk(pending.pop()):
+            helper = definitions.get(child.id) if isinstance(child, ast.Name) else None
+            if helper is not None and id(helper) not in seen:
+                seen.add(id(helper))
+                reached.append(helper)
+                pending.append(helper)
+    return reached
+
+
+def _mro(cls: ast.ClassDef, classes: dict) -> list:
+    """The class and its bases defined in the same module, nearest first."""
+    order = [cls]
+    for base in cls.bases:
+        if isinstance(base, ast.Name) and base.id in classes:
+            order += [c for c in _mro(classes[base.id], classes) if c not in order]
+    return order
+
+
+def build_map() -> dict:
+    tests = {}
+    for path in _test_files():
+        relative = path.relative_to(ROOT)
+        module = ".".join(relative.with_suffix("").parts)
+        tree = ast.parse(path.read_text())
+        imports = _imports(tree)
+        definitions = _definitions(tree)
+        classes = {
+            node.name: node for node in tree.body if isinstance(node, ast.ClassDef)
+        }
+        for cls in classes.values():
+            methods = {}
+            shared = []
+            for klass in _mro(cls, classes):
+                shared += klass.decorator_list + klass.bases
+                for node in klass.body:
+                    if not isinstance(node, FUNCTIONS):
+                        shared.append(node)
+                    elif node.name not in methods:
+                        methods[node.name] = node
+            shared += [
+                node for name, node in methods.items() if not name.startswith("test")
+            ]
+            for name, method in methods.items():
+                if not name.startswith("test"):
+                    continue
+                nodes = _with_helpers(shared + [method], definitions)
+                deps = _dependencies(nodes, imports)
+                deps.add(relative.as_posix())
+                tests[f"{module}.{cls.name}.{name}"] = sorted(deps)
+    return tests
+
+
+def load_map() -> dict:
+    fingerprint = _fingerprint()
+    if CACHE_FILE.exists():
+        cached = json.loads(CACHE_FILE.read_text())
+        if cached.get("fingerprint") == fingerprint:
+            return cached["tests"]
+    tests = build_map()
+    CACHE_FILE.write_text(json.dumps({"fingerprint": fingerprint, "tests": tests}))
+    return tests
+
+
+def changed_files(base: str) -> list:
+    def git(*args) -> list:
+        output = subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        return [line for line in output.splitlines() if line]
+
+    return git("diff", "--name-only", "--relative", base) + git(
+        "ls-files", "--others", "--exclude-standard"
+    )
+
+
+def select(files: list, tests: dict):
+    """Return the affected test labels, or None when the full run is needed."""
+    known = {dep for deps in tests.values() for dep in deps}
+    apps = {dep for dep in known if dep.endswith("/")}
+    selected = set()
+    for file in files:
+        path = Path(file)
+        if any(fnmatch.fnmatch(path.name, pattern) for pattern in DEPENDENCY_FILES):
+            return None
+        if path.suffix in DOC_SUFFIXES:
+            continue
+        app = f"{path.parts[0]}/" if len(path.parts) > 1 else None
+        if app in apps:
+            matches = [label for label, deps in tests.items() if app in deps]
+        elif file in known:
+            matches = [label for label, deps in tests.items() if file in deps]
+        elif path.parts[0] == "tests":
+            # Tooling in the kit (grader, selector...) that no test imports.
+            continue
+        else:
+            # Settings, root urls, requirements or an app no test touches:
+            # nothing tells which tests are safe to skip.
+            return None
+        selected.update(matches)
+    return sorted(selected)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run only the tests affected by the changes since a git ref."
+    )
+    parser.add_argument("--base", default="HEAD")
+    parser.add_argument("--run", action="store_true")
+    args = parser.parse_args()
+
+    labels = select(changed_files(args.base), load_map())
+    if labels is None:
+        labels = ["tests"]
+    if not labels:
+        return
+    print("\n".join(labels))
+    if args.run:
+        command = [sys.executable, "manage.py", "test", *labels]
+        sys.exit(subprocess.run(command, cwd=ROOT).returncode)
+
+
+if __name__ == "__main__":
+    main()
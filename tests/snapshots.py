@@ -0,0 +1,194 @@
+import hashlib
+import inspect
+import itertools
+import pickle
+import time
+from pathlib import Path
+
+from accounts.models import User
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection
+from genres.models import Genre
+from movies.models import Movie
+from reviews.models import Review
+from tests import mocks
+from tests.mocks import movie_info, review_info, user_info
+
+SNAPSHOT_DIR = Path(__file__).parent / ".snapshots"
+BATCH_SIZE = 5_000
+
+_datasets = {}
+
+
+def dataset(name: str):
+    def register(builder):
+        _datasets[name] = builder
+        return builder
+
+    return register
+
+
+def _snapshot_models():
+    return [User, Genre, Movie, Movie.genres.through, Review]
+
+
+def _sources(name: str) -> list:
+    sources = []
+    for model in (User, Genre, Movie, Review):
+        app_path = Path(apps.get_app_config(model._meta.app_label).path)
+        sources.append(Path(inspect.getsourcefile(model)))
+        sources += sorted((app_path / "migrations").glob("*.py"))
+    # Builders may be registered from other modules: hash the whole module they
+    # live in, so helpers they call also invalidate the snapshot.
+    sources += [
+        Path(mocks.__file__),
+        Path(__file__),
+        Path(inspect.getsourcefile(_datasets[name])),
+    ]
+    return sources
+
+
+def _fingerprint(name: str) -> str:
+    digest = hashlib.sha256()
+    for source in _sources(name):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    digest.update(inspect.getsource(_datasets[name]).encode())
+    digest.update(connection.vendor.encode())
+    return digest.hexdigest()[:16]
+
+
+def _dump(name: str, path: Path):
+    # Rows are stored already converted for the database (the vendor is part of
+    # the fingerprint), so restoring them is a plain executemany.
+    tables = []
+    for model in _snapshot_models():
+        fields = model._meta.concrete_fields
+        rows = model.objects.order_by("pk").values_list(
+            *(field.attname for field in fields)
+        )
+        tables.append(
+            [
+                tuple(
+                    field.get_db_prep_save(value, connection)
+                    for field, value in zip(fields, row)
+                )
+                for row in rows
+            ]
+        )
+    SNAPSHOT_DIR.mkdir(exist_ok=True)
+    partial = path.with_suffix(".partial")
+    with partial.open("wb") as file:
+        pickle.dump(tables, file, protocol=pickle.HIGHEST_PROTOCOL)
+    partial.replace(path)
+    for stale in SNAPSHOT_DIR.glob(f"{name}-*.pickle"):
+        if stale != path:
+            stale.unlink()
+
+
+def _load(path: Path):
+    with path.open("rb") as file:
+        tables = pickle.load(file)
+    models = _snapshot_models()
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for model, rows in zip(models, tables):
+            columns = [field.column for field in model._meta.concrete_fields]
+            sql = "INSERT INTO {} ({}) VALUES ({})".format(
+                quote(model._meta.db_table),
+                ", ".join(map(quote, columns)),
+                ", ".join(["%s"] * len(columns)),
+            )
+            for offset in range(0, len(rows), BATCH_SIZE):
+                cursor.executemany(sql, rows[offset : offset + BATCH_SIZE])
+        for sql in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(sql)
+
+
+def restore_snapshot(name: str) -> float:
+    """Seeds the dataset and returns how long it took, in seconds."""
+    # Snapshots capture whole tables, so this must run before any other seeding
+    # in setUpTestData.
+    start = time.perf_counter()
+    path = SNAPSHOT_DIR / f"{name}-{_fingerprint(name)}.pickle"
+    if path.exists():
+        _load(path)
+    else:
+        _datasets[name]()
+        _dump(name, path)
+    return time.perf_counter() - start
+
+
+def _create_critics(amount: int) -> list:
+    password = make_password(user_info()["password"])
+    User.objects.bulk_create(
+        [
+            User(
+                **{
+                    **info,
+                    "email": User.objects.normalize_email(info["email"]),
+                    "password": password,
+                }
+            )
+            for info in (user_info() for _ in range(amount))
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    return list(User.objects.order_by("id").values_list("id", flat=True))
+
+
+def _create_movies(amount: int) -> list:
+    genre_ids = [
+        Genre.objects.get_or_create(name=genre)[0].id for genre in mocks.movie_genres
+    ]
+    movies = []
+    for _ in range(amount):
+        info = movie_info()
+        info.pop("genres")
+        movies.append(Movie(**info))
+    Movie.objects.bulk_create(movies, batch_size=BATCH_SIZE)
+    movie_ids = list(Movie.objects.order_by("id").values_list("id", flat=True))
+
+    through = Movie.genres.through
+    movie_field = f"{Movie.genres.field.m2m_field_name()}_id"
+    genre_field = f"{Movie.genres.field.m2m_reverse_field_name()}_id"
+    through.objects.bulk_create(
+        [
+            through(**{movie_field: movie_id, genre_field: genre_id})
+            for movie_id in movie_ids
+            for genre_id in genre_ids
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    return movie_ids
+
+
+def _create_reviews(movie_ids: list, critic_ids: list, amount: int):
+    reviews_info = [review_info() for _ in range(100)]
+    movies = itertools.cycle(movie_ids)
+    critics = itertools.cycle(critic_ids)
+    infos = itertools.cycle(reviews_info)
+    for offset in range(0, amount, BATCH_SIZE):
+        Review.objects.bulk_create(
+            [
+                Review(**next(infos), movie_id=next(movies), critic_id=next(critics))
+                for _ in range(min(BATCH_SIZE, amount - offset))
+            ]
+        )
+
+
+@dataset("catalog-10k")
+def catalog_10k():
+    _create_movies(10_000)
+
+
+@dataset("reviews-100k")
+def reviews_100k():
+    _create_reviews(_create_movies(100), _create_critics(1_000), 100_000)
+
+
+@dataset("movie-reviews-50k")
+def movie_reviews_50k():
+    _create_reviews(_create_movies(1), _create_critics(50), 50_000)
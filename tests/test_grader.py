@@ -0,0 +1,119 @@
+import io
+import json
+import tempfile
+import textwrap
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import TestCase, mock
+
+from tests.grader import find_models, main, map_imports, parse_result
+
+
+def write(root: Path, files: dict):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(textwrap.dedent(content))
+
+
+class GraderTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+
+
+class FindModelsTests(GraderTestCase):
+    def test_if_models_are_found_in_every_layout(self):
+        write(
+            self.root,
+            {
+                "users/models.py": "class User: ...\n",
+                "catalog/models/__init__.py": "class Movie: ...\n",
+                "catalog/models/genre.py": "class Genre: ...\n",
+                "reviews/models.py": "class Review: ...\nclass Other: ...\n",
+            },
+        )
+        self.assertEqual(
+            find_models(self.root),
+            {
+                "User": "users.models",
+                "Movie": "catalog.models",
+                "Genre": "catalog.models.genre",
+                "Review": "reviews.models",
+            },
+        )
+
+    def test_if_virtualenvs_tests_and_broken_files_are_skipped(self):
+        write(
+            self.root,
+            {
+                "venv/lib/models.py": "class User: ...\n",
+                "tests/models.py": "class Movie: ...\n",
+                "broken/models.py": "class Genre(:\n",
+                "latin/models.py": "class Review: ...\n# \xe9\n".encode("latin-1"),
+            },
+        )
+        self.assertEqual(find_models(self.root), {})
+
+
+class MapImportsTests(GraderTestCase):
+    def test_if_model_imports_are_rewritten(self):
+        write(
+            self.root,
+            {
+                "test_routes.py": """
+                    from accounts.models import User
+                    from movies.models import Movie
+                    from genres.models import Genre
+                """
+            },
+        )
+        map_imports(self.root, {"User": "users.models", "Movie": "catalog.models"})
+        self.assertEqual(
+            (self.root / "test_routes.py").read_text().split(),
+            textwrap.dedent(
+                """
+                from users.models import User
+                from catalog.models import Movie
+                from genres.models import Genre
+                """
+            ).split(),
+        )
+
+
+class ParseResultTests(TestCase):
+    def test_if_passing_run_is_ok(self):
+        output = "....\n------\nRan 4 tests in 0.1s\n\nOK\n"
+        self.assertEqual(
+            parse_result(output), {"status": "ok", "passed": 4, "total": 4}
+        )
+
+    def test_if_failures_and_errors_are_subtracted(self):
+        output = "Ran 10 tests in 1.0s\n\nFAILED (failures=2, errors=1, skipped=3)\n"
+        self.assertEqual(
+            parse_result(output), {"status": "fail", "passed": 7, "total": 10}
+        )
+
+    def test_if_missing_summary_is_an_error(self):
+        output = "ModuleNotFoundError: No module named 'rest_framework'\n"
+        self.assertEqual(
+            parse_result(output), {"status": "error", "passed": 0, "total": 0}
+        )
+
+
+class MainTests(GraderTestCase):
+    def test_if_a_broken_project_does_not_abort_the_batch(self):
+        write(self.root, {"latin/manage.py": "# \xe9\n".encode("latin-1")})
+        report = self.root / "report.json"
+        argv = ["grader", str(self.root), "--jobs", "1", "--suites", "T1"]
+        with mock.patch("sys.argv", argv + ["--json", str(report)]):
+            with redirect_stdout(io.StringIO()) as output:
+                main()
+        self.assertIn("ERROR", output.getvalue())
+        result = json.loads(report.read_text())["latin"]["T1"]
+        self.assertEqual(result["status"], "error")
+        self.assertIn("UnicodeDecodeError", result["detail"])
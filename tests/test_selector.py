@@ -0,0 +1,161 @@
+import tempfile
+import textwrap
+from pathlib import Path
+from unittest import TestCase, mock
+
+from tests.selector import build_map, select
+
+TESTS = {
+    "tests.T1.test_routes.T1RouteTests.test_a": [
+        "accounts/",
+        "tests/T1/test_routes.py",
+        "tests/mocks.py",
+    ],
+    "tests.T4.test_routes.T4RouteTests.test_b": [
+        "accounts/",
+        "reviews/",
+        "tests/T4/test_routes.py",
+        "tests/mocks.py",
+    ],
+    "tests.perf.test_deletion.DeletionTests.test_c": [
+        "kmdb/deletion.py",
+        "movies/",
+        "tests/perf/test_deletion.py",
+    ],
+}
+
+
+class SelectorTests(TestCase):
+    def test_if_docs_are_ignored(self):
+        self.assertEqual(select(["README.md", "docs/guide.rst"], TESTS), [])
+
+    def test_if_app_change_selects_tests_touching_the_app(self):
+        self.assertEqual(
+            select(["reviews/views.py"], TESTS),
+            ["tests.T4.test_routes.T4RouteTests.test_b"],
+        )
+        self.assertEqual(
+            select(["accounts/models.py"], TESTS),
+            [
+                "tests.T1.test_routes.T1RouteTests.test_a",
+                "tests.T4.test_routes.T4RouteTests.test_b",
+            ],
+        )
+
+    def test_if_kit_change_selects_tests_importing_it(self):
+        self.assertEqual(
+            select(["kmdb/deletion.py"], TESTS),
+            ["tests.perf.test_deletion.DeletionTests.test_c"],
+        )
+        self.assertEqual(
+            select(["tests/T1/test_routes.py"], TESTS),
+            ["tests.T1.test_routes.T1RouteTests.test_a"],
+        )
+        self.assertEqual(len(select(["tests/mocks.py"], TESTS)), 2)
+
+    def test_if_kit_tooling_is_skipped(self):
+        self.assertEqual(select(["tests/grader.py"], TESTS), [])
+
+    def test_if_unmapped_changes_fall_back_to_full_run(self):
+        for file in [
+            "requirements.txt",
+            "requirements-dev.txt",
+            "Pipfile.lock",
+            "pyproject.toml",
+            "kmdb_project/settings.py",
+            "manage.py",
+            "notes.txt",
+        ]:
+            self.assertIsNone(select([file], TESTS), file)
+        self.assertIsNone(select(["reviews/views.py", "requirements.txt"], TESTS))
+
+
+PROJECT = {
+    "accounts/models.py": "class User: ...\n",
+    "movies/models.py": "class Movie: ...\n",
+    "genres/models.py": "class Genre: ...\n",
+    "reviews/models.py": "class Review: ...\n",
+    "kmdb/__init__.py": "",
+    "kmdb/deletion.py": "def delete_movie(movie_id): ...\n",
+    "kmdb/pool.py": "def metrics(): ...\n",
+    "tests/__init__.py": "",
+    "tests/mocks.py": "def movie_info(): ...\n",
+    "tests/perf/__init__.py": "",
+    "tests/perf/test_flows.py": """
+        from unittest import skipIf
+
+        from genres.models import Genre
+        from kmdb.deletion import delete_movie
+        from movies.models import Movie
+        from reviews.models import Review
+        from tests.mocks import movie_info
+
+        def create_movie():
+            return Movie(**movie_info())
+
+
+        @skipIf(Genre is None, "needs genres")
+        class Flows:
+            def flow(self):
+                return "reviews/"
+
+
+        class FlowTests(Flows):
+            def test_flow(self):
+                self.flow()
+
+
+        class DeletionTests:
+            def test_delete(self):
+                delete_movie(create_movie().id)
+
+            def test_nothing(self):
+                pass
+    """,
+}
+
+
+class BuildMapTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = Path(directory.name)
+        for name, content in PROJECT.items():
+            path = root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(textwrap.dedent(content))
+        patcher = mock.patch("tests.selector.ROOT", root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tests = build_map()
+
+    def deps(self, label: str) -> list:
+        return self.tests[f"tests.perf.test_flows.{label}"]
+
+    def test_if_base_class_methods_count(self):
+        self.assertIn("reviews/", self.deps("FlowTests.test_flow"))
+
+    def test_if_route_hitting_tests_depend_on_the_whole_kit(self):
+        deps = self.deps("FlowTests.test_flow")
+        self.assertIn("kmdb/deletion.py", deps)
+        self.assertIn("kmdb/pool.py", deps)
+
+    def test_if_module_helpers_count(self):
+        deps = self.deps("DeletionTests.test_delete")
+        for dep in ["movies/", "tests/mocks.py", "kmdb/deletion.py"]:
+            self.assertIn(dep, deps)
+        self.assertNotIn("kmdb/pool.py", deps)
+
+    def test_if_class_decorators_count(self):
+        self.assertIn("genres/", self.deps("FlowTests.test_flow"))
+
+    def test_if_tests_without_dependencies_map_to_their_file(self):
+        self.assertEqual(
+            self.deps("DeletionTests.test_nothing"), ["tests/perf/test_flows.py"]
+        )
+
+    def test_if_app_change_selects_tests_reaching_it_through_a_base_class(self):
+        self.assertEqual(
+            select(["reviews/views.py"], self.tests),
+            ["tests.perf.test_flows.FlowTests.test_flow"],
+        )